@@ -1,5 +1,21 @@
+import os
+
 from setuptools import find_packages, setup
 
+# Opt-in compiled build: MATHCUSTOM_MYPYC=1 pip install . compiles the
+# modules with mypyc using the existing type hints. A default install
+# stays pure Python with no dependencies.
+ext_modules = []
+if os.environ.get("MATHCUSTOM_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/mathCustom/complexe.py",
+            "src/mathCustom/vector.py",
+        ]
+    )
+
 setup(
     name="mathCustom",
     version="0.1.0",
@@ -10,4 +26,5 @@ setup(
     package_dir={"": "src"},
     install_requires=[],  # External dependencies, if any (e.g., numpy)
     license="MIT",
+    ext_modules=ext_modules,
 )
@@ -14,7 +14,7 @@ Example usage:
     v = Vec(1, 2, 3)
 """
 
-from .complexe import Compl
+from .complexe import Compl, ComplArray
 from .vector import Vec
 
-__all__ = ["Compl", "Vec"]
+__all__ = ["Compl", "ComplArray", "Vec"]
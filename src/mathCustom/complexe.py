@@ -1,8 +1,141 @@
+# PEP 563: keeps the Compl forward references below valid and leaves
+# annotations as strings at runtime, so they cost nothing per call.
 from __future__ import annotations
 
-from math import atan2, cos, pi, sin, sqrt
+from math import atan2, cos, hypot, pi, sin, sqrt
 
+# mypy_extensions is only present when building with mypyc; fall back
+# to a no-op decorator for plain pure-Python installs.
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
 
+    def mypyc_attr(*_attrs, **_kwattrs):  # type: ignore[misc]
+        def _deco(cls):
+            return cls
+
+        return _deco
+
+
+def _add_arr(
+    re1: list[float],
+    im1: list[float],
+    re2: list[float],
+    im2: list[float],
+) -> tuple[list[float], list[float]]:
+    """
+    Add two batches of complex numbers stored as parallel (real, img) lists.
+
+    Args:
+        re1, im1: Real and imaginary parts of the left operands.
+        re2, im2: Real and imaginary parts of the right operands.
+
+    Returns:
+        tuple[list[float], list[float]]: The (real, img) parts of the sums.
+    """
+    out_re = [a + c for a, c in zip(re1, re2)]
+    out_im = [b + d for b, d in zip(im1, im2)]
+    return out_re, out_im
+
+
+def _mul_arr(
+    re1: list[float],
+    im1: list[float],
+    re2: list[float],
+    im2: list[float],
+) -> tuple[list[float], list[float]]:
+    """
+    Multiply two batches of complex numbers stored as parallel lists.
+
+    Args:
+        re1, im1: Real and imaginary parts of the left operands.
+        re2, im2: Real and imaginary parts of the right operands.
+
+    Returns:
+        tuple[list[float], list[float]]: The (real, img) parts of the products.
+    """
+    out_re = [a * c - b * d for a, b, c, d in zip(re1, im1, re2, im2)]
+    out_im = [a * d + b * c for a, b, c, d in zip(re1, im1, re2, im2)]
+    return out_re, out_im
+
+
+def _div_arr(
+    re1: list[float],
+    im1: list[float],
+    re2: list[float],
+    im2: list[float],
+) -> tuple[list[float], list[float]]:
+    """
+    Divide two batches of complex numbers stored as parallel lists.
+
+    Each division computes the reciprocal of the denominator norm once and
+    reuses it for both components.
+
+    Args:
+        re1, im1: Real and imaginary parts of the numerators.
+        re2, im2: Real and imaginary parts of the denominators.
+
+    Returns:
+        tuple[list[float], list[float]]: The (real, img) parts of the
+                                         quotients.
+
+    Raises:
+        ZeroDivisionError: If any denominator is zero.
+    """
+    out_re: list[float] = []
+    out_im: list[float] = []
+
+    for a, b, c, d in zip(re1, im1, re2, im2):
+        recip = 1.0 / (c * c + d * d)
+        out_re.append((a * c + b * d) * recip)
+        out_im.append((b * c - a * d) * recip)
+
+    return out_re, out_im
+
+
+def _type_error(op: str, left: object, right: object) -> TypeError:
+    """
+    Build the TypeError raised by a binary operator for unsupported types.
+
+    Kept out of the operators so the hot dispatch path never pays for
+    constructing the message.
+
+    Args:
+        op (str): The operator symbol, e.g. "+".
+        left: The left operand.
+        right: The right operand.
+
+    Returns:
+        TypeError: The error ready to be raised.
+    """
+    return TypeError(
+        f"Unsupported operation ({op}) between types "
+        f"{type(left).__name__} and {type(right).__name__}"
+    )
+
+
+# Format strings for Compl.__str__, keyed on (real != 0, sign of img).
+# The unit table handles |img| == 1, which displays 1i as just i.
+_FORMATS: dict[tuple[bool, int], str] = {
+    (True, 1): "({r:g} + {ai:g}i)",
+    (True, -1): "({r:g} - {ai:g}i)",
+    (True, 0): "({r:g})",
+    (False, 1): "({ai:g}i)",
+    (False, -1): "(- {ai:g}i)",
+    (False, 0): "0",
+}
+
+_UNIT_FORMATS: dict[tuple[bool, int], str] = {
+    (True, 1): "({r:g} + i)",
+    (True, -1): "({r:g} - i)",
+    (False, 1): "(i)",
+    (False, -1): "(- i)",
+}
+
+
+# The _make fast paths bypass __init__ via object.__new__, which
+# native (compiled) classes forbid; compile as a regular class.
+@mypyc_attr(native_class=False)
 class Compl:
     """
     A class representing complex numbers.
@@ -31,6 +164,8 @@ class Compl:
         (1 + i)
     """
 
+    __slots__ = ("real", "img", "_trig_cache")
+
     def __init__(self, real: float | complex | None = None, img: float | None = None) -> None:
         """
         Initialize a new complex number with given real and imaginary parts,
@@ -49,8 +184,125 @@ class Compl:
             self.img: float = real.imag
 
         else:
-            self.real = real if real else 0
-            self.img = img if img else 0
+            self.real = 0 if real is None else real
+            self.img = 0 if img is None else img
+
+    @classmethod
+    def _make(cls, real: float, img: float) -> Compl:
+        """
+        Build a Compl directly from known-numeric parts.
+
+        Internal fast path for the arithmetic operators: skips the
+        isinstance dispatch done by __init__ since the operators already
+        validated their operands.
+
+        Args:
+            real (float): The real part of the complex number.
+            img (float): The imaginary part of the complex number.
+
+        Returns:
+            Compl: A new Compl with the given parts.
+        """
+        c: Compl = object.__new__(cls)
+        c.real = real
+        c.img = img
+        return c
+
+    @classmethod
+    def from_complex(cls, z: complex) -> Compl:
+        """
+        Build a Compl from a Python built-in complex number.
+
+        Monomorphic alternative to passing a complex to __init__: no
+        isinstance branch, just two attribute reads.
+
+        Args:
+            z (complex): The complex number to convert.
+
+        Returns:
+            Compl: A new Compl with the same value.
+
+        Example:
+            >>> Compl.from_complex(2 + 3j)
+            (2 + 3i)
+        """
+        return cls._make(z.real, z.imag)
+
+    @classmethod
+    def from_arrays(
+        cls, reals: list[float], imgs: list[float]
+    ) -> list[Compl]:
+        """
+        Build a batch of complex numbers from parallel (real, img) lists.
+
+        Bridge from the array layout used by the module-level batch helpers
+        (`_add_arr`, `_mul_arr`, ...) back to Compl instances.
+
+        Args:
+            reals (list[float]): The real parts.
+            imgs (list[float]): The imaginary parts.
+
+        Returns:
+            list[Compl]: One Compl per (real, img) pair.
+
+        Example:
+            >>> Compl.from_arrays([1, 0], [0, 1])
+            [(1), (i)]
+        """
+        return [cls._make(r, i) for r, i in zip(reals, imgs)]
+
+    @classmethod
+    def pow_batch(
+        cls,
+        reals: list[float],
+        imgs: list[float],
+        exponent: float,
+    ) -> tuple[list[float], list[float]]:
+        """
+        Raise a whole batch of complex numbers to a real exponent.
+
+        Delegates each power to the C-coded built-in complex, so a loop
+        of N powers costs N C calls instead of N full __pow__ dispatches
+        with their trig round-trips.
+
+        Args:
+            reals (list[float]): The real parts.
+            imgs (list[float]): The imaginary parts.
+            exponent (int | float): The exponent to raise each number to.
+
+        Returns:
+            tuple[list[float], list[float]]: The (real, img) parts of the
+                                             results.
+        """
+        out_re: list[float] = []
+        out_im: list[float] = []
+
+        for a, b in zip(reals, imgs):
+            w: complex = complex(a, b) ** exponent
+            out_re.append(w.real)
+            out_im.append(w.imag)
+
+        return out_re, out_im
+
+    @staticmethod
+    def to_arrays(
+        numbers: list[Compl],
+    ) -> tuple[list[float], list[float]]:
+        """
+        Split a batch of complex numbers into parallel (real, img) lists.
+
+        Bridge to the array layout used by the module-level batch helpers,
+        which process whole batches per call instead of paying operator
+        dispatch per element.
+
+        Args:
+            numbers (list[Compl]): The complex numbers to split.
+
+        Returns:
+            tuple[list[float], list[float]]: The real parts and the
+                                             imaginary parts.
+        """
+        return [c.real for c in numbers], [c.img for c in numbers]
 
     def norm(self) -> float:
         """
@@ -64,7 +316,7 @@ class Compl:
             >>> c.norm()
             5.0
         """
-        return sqrt(self.real**2 + self.img**2)
+        return hypot(self.real, self.img)
 
     def conjugate(self) -> Compl:
         """
@@ -78,7 +330,7 @@ class Compl:
             >>> print(c.conjugate())
             (3 - 4i)
         """
-        return Compl(self.real, -self.img)
+        return Compl._make(self.real, -self.img)
 
     def reciprocal(self) -> Compl:
         """
@@ -95,9 +347,52 @@ class Compl:
 
         # https://en.wikipedia.org/wiki/Complex_number
         # 1 / (a + bi) = (a - bi) / (a^2 + b^2) = (a / (a^2 + b^2)) - (b / (a^2 + b^2))i
-        return Compl(
-            self.real / (self.real**2 + self.img**2),
-            -self.img / (self.real**2 + self.img**2),
+        denom: float = self.real * self.real + self.img * self.img
+        return Compl._make(self.real / denom, -self.img / denom)
+
+    def muladd(self, a: Compl, b: Compl) -> Compl:
+        """
+        Compute self + a * b in one fused step.
+
+        Equivalent to `self + a * b` but builds no intermediate Compl
+        for the product; both components go straight into the result.
+
+        Args:
+            a (Compl): The first factor.
+            b (Compl): The second factor.
+
+        Returns:
+            Compl: A new complex number representing self + a * b.
+
+        Example:
+            >>> Compl(1, 1).muladd(Compl(0, 1), Compl(0, 1))
+            (i)
+        """
+        return Compl._make(
+            self.real + (a.real * b.real - a.img * b.img),
+            self.img + (a.real * b.img + a.img * b.real),
+        )
+
+    def mul_conj(self, other: Compl) -> Compl:
+        """
+        Compute self * other.conjugate() in one fused step.
+
+        Equivalent to `self * other.conjugate()` but skips allocating
+        the intermediate conjugate.
+
+        Args:
+            other (Compl): The number whose conjugate to multiply by.
+
+        Returns:
+            Compl: A new complex number representing the product.
+
+        Example:
+            >>> Compl(3, 4).mul_conj(Compl(3, 4))
+            (25)
+        """
+        return Compl._make(
+            self.real * other.real + self.img * other.img,
+            self.img * other.real - self.real * other.img,
         )
 
     def trig(self) -> tuple[float, float]:
@@ -115,7 +410,23 @@ class Compl:
             >>> print(f"Norm: {norm:.2f}, Angle: {angle:.2f}")
             Norm: 1.41, Angle: 0.79
         """
-        return self.norm(), atan2(self.img, self.real)
+        # The cache stores the parts it was computed from, so a mutated
+        # instance (in-place ops or direct attribute writes) recomputes
+        # instead of returning a stale polar form.
+        cache = getattr(self, "_trig_cache", None)
+
+        if (
+            cache is not None
+            and cache[0] == self.real
+            and cache[1] == self.img
+        ):
+            return cache[2], cache[3]
+
+        norm: float = hypot(self.real, self.img)
+        angle: float = atan2(self.img, self.real)
+        self._trig_cache = (self.real, self.img, norm, angle)
+
+        return norm, angle
 
     def __str__(self) -> str:
         """
@@ -129,34 +440,14 @@ class Compl:
             >>> print(c)
             (1 + 1i)
         """
-        realDisp: str = ""
-        sign: str = ""
-        imgDisp: str = ""
-
-        if self.real != 0:
-            realDisp = f"{self.real:g}"
-
-        if self.img > 0:
-            sign = "+" if self.real != 0 else ""
-        elif self.img < 0:
-            sign = "-"
-
-        abs_img = abs(self.img)
-        if abs_img == 1:
-            imgDisp = "i"  # Displays 1i as just i
-        elif abs_img != 0:
-            imgDisp = f"{abs_img:g}i"
-
-        if not realDisp and not imgDisp:
-            return "0"
-
-        return (
-            f"({realDisp}"
-            f"{' ' if realDisp and sign else ''}"
-            f"{sign}"
-            f"{' ' if sign else ''}"
-            f"{imgDisp})"
-        )
+        real: float = self.real
+        img: float = self.img
+
+        sign: int = (img > 0) - (img < 0)
+        abs_img: float = img if img > 0 else -img
+
+        table = _UNIT_FORMATS if abs_img == 1 else _FORMATS
+        return table[(real != 0, sign)].format(r=real, ai=abs_img)
 
     def __repr__(self) -> str:
         """
@@ -177,7 +468,8 @@ class Compl:
         Add another complex number or a scalar to this complex number.
 
         Args:
-            other (Compl | int | float): The complex number or scalar to add.
+            other (Compl | int | float | complex): The complex number
+                                                   or scalar to add.
 
         Returns:
             Compl: A new complex number representing the sum.
@@ -185,18 +477,20 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             # https://en.wikipedia.org/wiki/Complex_number
             # (a + bi) + (c + di) = (a+c) + (b+d)i
-            return Compl(self.real + other.real, self.img + other.img)
+            return Compl._make(self.real + other.real, self.img + other.img)
 
         elif isinstance(other, (int, float)):
-            return Compl(self.real + other, self.img)
+            return Compl._make(self.real + other, self.img)
 
-        raise TypeError(
-            f"Unsupported operation (+) between types {type(self).__name__}"
-            f" and {type(other).__name__}"
-        )
+        elif isinstance(other, complex):
+            # Built-in complex arithmetic is C-coded; delegate and wrap.
+            z: complex = complex(self.real, self.img) + other
+            return Compl._make(z.real, z.imag)
+
+        raise _type_error("+", self, other)
 
     def __radd__(self, other) -> Compl:
         """
@@ -218,7 +512,8 @@ class Compl:
         Subtract another complex number or a scalar from this complex number.
 
         Args:
-            other (Compl | int | float): The complex number or scalar to subtract.
+            other (Compl | int | float | complex): The complex number
+                                                   or scalar to subtract.
 
         Returns:
             Compl: A new complex number representing the difference.
@@ -226,18 +521,19 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             # https://en.wikipedia.org/wiki/Complex_number
             # (a + bi) - (c + di) = (a - c) + (b - d)i
-            return Compl(self.real - other.real, self.img - other.img)
+            return Compl._make(self.real - other.real, self.img - other.img)
 
         elif isinstance(other, (int, float)):
-            return Compl(self.real - other, self.img)
+            return Compl._make(self.real - other, self.img)
 
-        raise TypeError(
-            f"Unsupported operation (-) between types {type(self).__name__}"
-            f" and {type(other).__name__}"
-        )
+        elif isinstance(other, complex):
+            z: complex = complex(self.real, self.img) - other
+            return Compl._make(z.real, z.imag)
+
+        raise _type_error("-", self, other)
 
     def __rsub__(self, other) -> Compl:
         """
@@ -252,23 +548,25 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
-            return Compl(other.real - self.real, other.img - self.img)
+        if other.__class__ is Compl or isinstance(other, Compl):
+            return Compl._make(other.real - self.real, other.img - self.img)
 
         elif isinstance(other, (int, float)):
-            return Compl(other - self.real, -self.img)
+            return Compl._make(other - self.real, -self.img)
 
-        raise TypeError(
-            f"Unsupported operation (-) between types {type(other).__name__}"
-            f" and {type(self).__name__}"
-        )
+        elif isinstance(other, complex):
+            z: complex = other - complex(self.real, self.img)
+            return Compl._make(z.real, z.imag)
+
+        raise _type_error("-", other, self)
 
     def __mul__(self, other) -> Compl:
         """
         Multiply this complex number by another complex number or a scalar.
 
         Args:
-            other (Compl | int | float): The complex number or scalar to multiply by.
+            other (Compl | int | float | complex): The complex number
+                                                   or scalar to multiply by.
 
         Returns:
             Compl: A new complex number representing the product.
@@ -276,10 +574,10 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        realPart: float = 0
-        imgPart: float = 0
+        realPart: float = 0.0
+        imgPart: float = 0.0
 
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             # https://en.wikipedia.org/wiki/Complex_number
             # (a + bi)(c + di) = (ac - bd) + (ad + bc)i
             realPart = (self.real * other.real) - (self.img * other.img)
@@ -289,13 +587,15 @@ class Compl:
             realPart = other * self.real
             imgPart = other * self.img
 
+        elif isinstance(other, complex):
+            z: complex = complex(self.real, self.img) * other
+            realPart = z.real
+            imgPart = z.imag
+
         else:
-            raise TypeError(
-                f"Unsupported operation (*) between types {type(self).__name__}"
-                f"and {type(other).__name__}"
-            )
+            raise _type_error("*", self, other)
 
-        return Compl(realPart, imgPart)
+        return Compl._make(realPart, imgPart)
 
     def __rmul__(self, other) -> Compl:
         """
@@ -319,7 +619,7 @@ class Compl:
         Returns:
             Compl: A new complex number with all coordinates negated.
         """
-        return Compl(-self.real, -self.img)
+        return Compl._make(-self.real, -self.img)
 
     def __eq__(self, other) -> bool:
         """
@@ -331,13 +631,13 @@ class Compl:
         Returns:
             bool: True if the complex numbers are equal, False otherwise.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             return (self.real == other.real) and (self.img == other.img)
 
-        elif isinstance(other, (int, float)) and other == 0:
-            return self.real + self.img == other
+        elif isinstance(other, (int, float)):
+            return self.img == 0 and self.real == other
 
-        return False
+        return NotImplemented
 
     def __ne__(self, other) -> bool:
         """
@@ -349,14 +649,35 @@ class Compl:
         Returns:
             bool: True if the complex numbers are not equal, False otherwise.
         """
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self) -> int:
+        """
+        Hash the complex number consistently with __eq__.
+
+        A Compl with a zero imaginary part compares equal to the bare
+        scalar, so it must hash like one.
+
+        Returns:
+            int: The hash of the complex number.
+        """
+        if self.img == 0:
+            return hash(self.real)
+
+        return hash(complex(self.real, self.img))
 
     def __truediv__(self, other) -> Compl:
         """
         Divide this complex number by another complex number or a scalar.
 
         Args:
-            other (Compl | int | float): The complex number or scalar to divide by.
+            other (Compl | int | float | complex): The complex number
+                                                   or scalar to divide by.
 
         Returns:
             Compl: A new complex number representing the division result.
@@ -365,31 +686,35 @@ class Compl:
             ZeroDivisionError: If the scalar is zero.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             if other == 0:
                 raise ZeroDivisionError("Tried to divide by complex number 0")
 
             # https://en.wikipedia.org/wiki/Complex_number
-            realPart: float = (
-                (self.real * other.real) + (self.img * other.img)
-            ) / (other.real**2 + other.img**2)
+            a: float = self.real
+            b: float = self.img
+            c: float = other.real
+            d: float = other.img
 
-            imgPart: float = (
-                (self.img * other.real) - (other.img * self.real)
-            ) / (other.real**2 + other.img**2)
+            # One reciprocal, then two multiplies per component
+            inv: float = 1.0 / (c * c + d * d)
 
-            return Compl(realPart, imgPart)
+            return Compl._make((a * c + b * d) * inv, (b * c - a * d) * inv)
 
         elif isinstance(other, (int, float)):
             if other == 0:
                 raise ZeroDivisionError
 
-            return Compl(self.real / other, self.img / other)
+            return Compl._make(self.real / other, self.img / other)
 
-        raise TypeError(
-            f"Unsupported operation (/) between types {type(self).__name__}"
-            f" and + {type(other).__name__}"
-        )
+        elif isinstance(other, complex):
+            if other == 0:
+                raise ZeroDivisionError("Tried to divide by complex number 0")
+
+            z: complex = complex(self.real, self.img) / other
+            return Compl._make(z.real, z.imag)
+
+        raise _type_error("/", self, other)
 
     def __rtruediv__(self, other) -> Compl:
         """
@@ -405,35 +730,32 @@ class Compl:
             ZeroDivisionError: If the scalar is zero.
             TypeError: If the operation is not supported.
         """
-        realPart: float = 0
-        imgPart: float = 0
+        realPart: float = 0.0
+        imgPart: float = 0.0
 
-        if isinstance(other, Compl):
-            realPart = ((other.real * self.real) + (other.img * self.img)) / (
-                self.real**2 + self.img**2
-            )
+        a: float = self.real
+        b: float = self.img
 
-            imgPart = ((other.img * self.real) - (self.img * other.real)) / (
-                self.real**2 + self.img**2
+        if not a and not b:
+            raise ZeroDivisionError(
+                "Complex number at the denominator happens to be 0"
             )
 
-        elif isinstance(other, (int, float)):
-            if not self.real and not self.img:
-                raise ZeroDivisionError(
-                    "Complex number at the denominator happens to be 0"
-                )
+        inv: float = 1.0 / (a * a + b * b)
 
-            conj: Compl = self.conjugate()
-            realPart = (other * self.real) / (self.real**2 + self.img**2)
-            imgPart = (other * self.img) / (self.real**2 + self.img**2)
+        if other.__class__ is Compl or isinstance(other, Compl):
+            realPart = (other.real * a + other.img * b) * inv
+            imgPart = (other.img * a - b * other.real) * inv
 
-            if conj.img < 0:
-                imgPart *= -1
+        elif isinstance(other, (int, float)):
+            # other / (a + bi) = other * (a - bi) / (a^2 + b^2)
+            realPart = (other * a) * inv
+            imgPart = -(other * b) * inv
 
         else:
-            raise TypeError("Tried to divide with a non digit type")
+            raise _type_error("/", other, self)
 
-        return Compl(realPart, imgPart)
+        return Compl._make(realPart, imgPart)
 
     def __pow__(self, exponent) -> Compl:
         """
@@ -453,25 +775,60 @@ class Compl:
             raise TypeError("Exponent must be a real number")
 
         if exponent == 0:
-            return Compl(1, 0)
+            return Compl._make(1, 0)
 
         if self.real == 0 and self.img == 0:
             if exponent > 0:
-                return Compl(0, 0)
+                return Compl._make(0, 0)
             else:
                 raise ValueError("Cannot raise 0 to a negative or zero power")
 
+        if isinstance(exponent, int):
+            # Exponentiation by squaring: log2(n) complex multiplies
+            # instead of the sqrt/atan2/cos/sin of the polar route.
+            n: int = -exponent if exponent < 0 else exponent
+            resultReal: float = 1.0
+            resultImg: float = 0.0
+            baseReal: float = self.real
+            baseImg: float = self.img
+
+            while n:
+                if n & 1:
+                    resultReal, resultImg = (
+                        resultReal * baseReal - resultImg * baseImg,
+                        resultReal * baseImg + resultImg * baseReal,
+                    )
+                baseReal, baseImg = (
+                    baseReal * baseReal - baseImg * baseImg,
+                    2 * baseReal * baseImg,
+                )
+                n >>= 1
+
+            if exponent < 0:
+                denom: float = (
+                    resultReal * resultReal + resultImg * resultImg
+                )
+                return Compl._make(resultReal / denom, -resultImg / denom)
+
+            return Compl._make(resultReal, resultImg)
+
         r, theta = self.trig()
         new_r = r**exponent
         new_theta = theta * exponent
 
-        # Handle potential precision issues for purely real or imaginary results
-        if abs(new_theta) < 1e-10 or abs(abs(new_theta) - pi) < 1e-10:
-            return Compl(round(new_r * cos(new_theta), 10), 0)
-        elif abs(abs(new_theta) - pi / 2) < 1e-10:
-            return Compl(0, round(new_r * sin(new_theta), 10))
+        # Handle potential precision issues for purely real or imaginary
+        # results: one test against the nearest multiple of pi/2 instead
+        # of separate 0 / pi / pi/2 threshold checks.
+        k: float = new_theta / (pi / 2)
+        quadrant: int = round(k)
 
-        return Compl(new_r * cos(new_theta), new_r * sin(new_theta))
+        if abs(k - quadrant) < 1e-10:
+            if quadrant & 1:
+                return Compl._make(0, round(new_r * sin(new_theta), 10))
+
+            return Compl._make(round(new_r * cos(new_theta), 10), 0)
+
+        return Compl._make(new_r * cos(new_theta), new_r * sin(new_theta))
 
     def __iadd__(self, other) -> Compl:
         """
@@ -486,7 +843,7 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             self.real += other.real
             self.img += other.img
 
@@ -494,10 +851,7 @@ class Compl:
             self.real += other
 
         else:
-            raise TypeError(
-                f"Unsupported operation (+) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            raise _type_error("+", self, other)
 
         return self
 
@@ -514,7 +868,7 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
+        if other.__class__ is Compl or isinstance(other, Compl):
             self.real -= other.real
             self.img -= other.img
 
@@ -522,10 +876,7 @@ class Compl:
             self.real -= other
 
         else:
-            raise TypeError(
-                f"Unsupported operation (-) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            raise _type_error("-", self, other)
 
         return self
 
@@ -542,19 +893,22 @@ class Compl:
         Raises:
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Compl):
-            self.real = (self.real * other.real) - (self.img * other.img)
-            self.img = (self.real * other.img) + (self.img * other.real)
+        if other.__class__ is Compl or isinstance(other, Compl):
+            realPart: float = (
+                (self.real * other.real) - (self.img * other.img)
+            )
+            imgPart: float = (
+                (self.real * other.img) + (self.img * other.real)
+            )
+            self.real = realPart
+            self.img = imgPart
 
         elif isinstance(other, (int, float)):
             self.real *= other
             self.img *= other
 
         else:
-            raise TypeError(
-                f"Unsupported operation (*) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            raise _type_error("*", self, other)
 
         return self
 
@@ -572,13 +926,16 @@ class Compl:
             TypeError: If the operation is not supported.
             ZeroDivisionError: If the divisor is zero.
         """
-        if isinstance(other, Compl):
-            self.real = ((self.real * other.real) + (self.img * other.img)) / (
-                other.real**2 + other.img**2
-            )
-
-            self.img = ((self.img * other.real) - (other.img * self.real)) / (
-                other.real**2 + other.img**2
+        if other.__class__ is Compl or isinstance(other, Compl):
+            a: float = self.real
+            b: float = self.img
+            c: float = other.real
+            d: float = other.img
+            inv: float = 1.0 / (c * c + d * d)
+
+            self.real, self.img = (
+                (a * c + b * d) * inv,
+                (b * c - a * d) * inv,
             )
 
         elif isinstance(other, (int, float)):
@@ -588,10 +945,7 @@ class Compl:
             self.img /= other
 
         else:
-            raise TypeError(
-                f"Unsupported operation (/) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            raise _type_error("/", self, other)
 
         return self
 
@@ -602,7 +956,7 @@ class Compl:
         Returns:
             float: The magnitude of the complex number.
         """
-        return self.norm()
+        return hypot(self.real, self.img)
 
     def __int__(self) -> int:
         """
@@ -613,7 +967,7 @@ class Compl:
         """
         if self.img == 0:
             return int(self.real)
-        return int(self.norm())
+        return int(hypot(self.real, self.img))
 
     def __float__(self) -> float:
         """
@@ -624,7 +978,7 @@ class Compl:
         """
         if self.img == 0:
             return float(self.real)
-        return self.norm()
+        return hypot(self.real, self.img)
 
     def __complex__(self) -> complex:
         """
@@ -636,6 +990,224 @@ class Compl:
         return complex(self.real, self.img)
 
 
+# The _make fast paths bypass __init__ via object.__new__, which
+# native (compiled) classes forbid; compile as a regular class.
+@mypyc_attr(native_class=False)
+class ComplArray:
+    """
+    A batch of complex numbers stored as two parallel lists (SoA layout).
+
+    Instead of holding N Compl objects (one allocation and two attribute
+    lookups per element), the real and imaginary parts live in two
+    contiguous lists, and arithmetic runs through the module-level batch
+    helpers in a single pass per component.
+
+    Attributes:
+        `_re` (list[float]): The real parts.
+        `_im` (list[float]): The imaginary parts.
+
+    Examples:
+        >>> batch = ComplArray([1, 0], [0, 1])
+        >>> batch[1]
+        (i)
+        >>> print(batch * batch)
+        [(1), (-1)]
+    """
+
+    __slots__ = ("_re", "_im")
+
+    def __init__(self, reals, imgs) -> None:
+        """
+        Initialize a batch from parallel real and imaginary parts.
+
+        Args:
+            reals (Iterable[float]): The real parts.
+            imgs (Iterable[float]): The imaginary parts.
+
+        Raises:
+            ValueError: If the two parts have different lengths.
+        """
+        self._re: list[float] = list(reals)
+        self._im: list[float] = list(imgs)
+
+        if len(self._re) != len(self._im):
+            raise ValueError(
+                "Real and imaginary parts must have the same length"
+            )
+
+    @classmethod
+    def from_compls(cls, numbers: list[Compl]) -> ComplArray:
+        """
+        Build a batch from a sequence of Compl instances.
+
+        Args:
+            numbers (list[Compl]): The complex numbers to batch.
+
+        Returns:
+            ComplArray: A batch holding the same values.
+        """
+        return cls(*Compl.to_arrays(numbers))
+
+    def to_compls(self) -> list[Compl]:
+        """
+        Convert the batch back into individual Compl instances.
+
+        Returns:
+            list[Compl]: One Compl per element of the batch.
+        """
+        return Compl.from_arrays(self._re, self._im)
+
+    def __len__(self) -> int:
+        """
+        Get the number of complex numbers in the batch.
+
+        Returns:
+            int: The batch size.
+        """
+        return len(self._re)
+
+    def __getitem__(self, index: int) -> Compl:
+        """
+        Get a single element of the batch as a Compl.
+
+        Args:
+            index (int): The position of the element.
+
+        Returns:
+            Compl: The complex number at that position.
+        """
+        return Compl._make(self._re[index], self._im[index])
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the batch.
+
+        Returns:
+            str: A list-style string of the elements.
+        """
+        return f"[{', '.join(str(c) for c in self.to_compls())}]"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the batch.
+
+        Returns:
+            str: Same as __str__ method.
+        """
+        return self.__str__()
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if this batch is elementwise equal to another batch.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if both batches hold the same values.
+        """
+        if isinstance(other, ComplArray):
+            return self._re == other._re and self._im == other._im
+
+        return False
+
+    def __add__(self, other: ComplArray) -> ComplArray:
+        """
+        Add another batch elementwise.
+
+        Args:
+            other (ComplArray): The batch to add.
+
+        Returns:
+            ComplArray: A new batch holding the sums.
+
+        Raises:
+            ValueError: If the batches have different lengths.
+            TypeError: If the operation is not supported.
+        """
+        if not isinstance(other, ComplArray):
+            raise _type_error("+", self, other)
+
+        if len(self._re) != len(other._re):
+            raise ValueError("Cannot add batches of different sizes")
+
+        return ComplArray(
+            *_add_arr(self._re, self._im, other._re, other._im)
+        )
+
+    def __mul__(self, other: ComplArray) -> ComplArray:
+        """
+        Multiply by another batch elementwise.
+
+        Args:
+            other (ComplArray): The batch to multiply by.
+
+        Returns:
+            ComplArray: A new batch holding the products.
+
+        Raises:
+            ValueError: If the batches have different lengths.
+            TypeError: If the operation is not supported.
+        """
+        if not isinstance(other, ComplArray):
+            raise _type_error("*", self, other)
+
+        if len(self._re) != len(other._re):
+            raise ValueError("Cannot multiply batches of different sizes")
+
+        return ComplArray(
+            *_mul_arr(self._re, self._im, other._re, other._im)
+        )
+
+    def __pow__(self, exponent) -> ComplArray:
+        """
+        Raise every element of the batch to a real exponent.
+
+        Args:
+            exponent (int | float): The exponent to raise to.
+
+        Returns:
+            ComplArray: A new batch holding the results.
+
+        Raises:
+            TypeError: If the exponent is not a real number.
+        """
+        if not isinstance(exponent, (int, float)):
+            raise TypeError("Exponent must be a real number")
+
+        return ComplArray(
+            *Compl.pow_batch(self._re, self._im, exponent)
+        )
+
+    def __truediv__(self, other: ComplArray) -> ComplArray:
+        """
+        Divide by another batch elementwise.
+
+        The denominator norm is computed once per element and reused for
+        both components.
+
+        Args:
+            other (ComplArray): The batch to divide by.
+
+        Returns:
+            ComplArray: A new batch holding the quotients.
+
+        Raises:
+            ValueError: If the batches have different lengths.
+            ZeroDivisionError: If any denominator is zero.
+            TypeError: If the operation is not supported.
+        """
+        if not isinstance(other, ComplArray):
+            raise _type_error("/", self, other)
+
+        if len(self._re) != len(other._re):
+            raise ValueError("Cannot divide batches of different sizes")
+
+        return ComplArray(
+            *_div_arr(self._re, self._im, other._re, other._im)
+        )
+
+
 def main() -> None:
     i: Compl = Compl(0, 1)
     print((1 + i) ** 2)
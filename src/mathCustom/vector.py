@@ -1,8 +1,107 @@
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterable
+from math import hypot
+from operator import add, mul, neg, sub, truediv
 
+# mypy_extensions is only present when building with mypyc; fall back
+# to a no-op decorator for plain pure-Python installs.
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
 
+    def mypyc_attr(*_attrs, **_kwattrs):  # type: ignore[misc]
+        def _deco(cls):
+            return cls
+
+        return _deco
+
+
+# Coordinate storage for Vec: a plain tuple by default, an array('d')
+# buffer (from_doubles), or a memoryview row (from_rows).
+_Coords = tuple[float | int, ...] | array | memoryview
+
+
+def _dot(a: _Coords | list, b: _Coords | list) -> float | int:
+    """
+    Dot product of two same-length coordinate tuples.
+
+    Unrolled for the 2-D and 3-D vectors that dominate use — no zip
+    tuples, no generator frame — with a single map/sum pass for longer
+    ones.
+
+    Args:
+        a, b: The coordinate tuples. Lengths must already match.
+
+    Returns:
+        float | int: The dot product.
+    """
+    n = len(a)
+
+    if n == 3:
+        return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+    if n == 2:
+        return a[0] * b[0] + a[1] * b[1]
+
+    return sum(map(mul, a, b))
+
+
+def _type_error(op: str, left: object, right: object) -> TypeError:
+    """
+    Build the TypeError raised by a binary operator for unsupported types.
+
+    Args:
+        op (str): The operator symbol, e.g. "+".
+        left: The left operand.
+        right: The right operand.
+
+    Returns:
+        TypeError: The error ready to be raised.
+    """
+    return TypeError(
+        f"Unsupported operation ({op}) between types "
+        f"{type(left).__name__} and {type(right).__name__}"
+    )
+
+
+def _as_coords(x: object) -> _Coords | list | None:
+    """
+    View a Vec-compatible operand as its coordinate sequence.
+
+    Lets the operators accept a bare list or tuple wherever a Vec is
+    expected, so callers need not wrap intermediates in Vec() — one
+    allocation less per arithmetic step.
+
+    Args:
+        x: The operand to inspect.
+
+    Returns:
+        _Coords | list | None: The coordinates, or None if x is not
+        Vec-compatible.
+    """
+    if isinstance(x, Vec):
+        return x._coords
+
+    if isinstance(x, (list, tuple)):
+        return x
+
+    return None
+
+
+# Verbs for the size-mismatch ValueError raised by the shared operators
+_OP_VERBS: dict[str, str] = {
+    "+": "add",
+    "-": "subtract",
+    "*": "multiply",
+    "/": "divide",
+}
+
+
+# The _make fast path bypasses __init__ via object.__new__, which
+# native (compiled) classes forbid; compile as a regular class.
+@mypyc_attr(native_class=False)
 class Vec:
     """
     A class representing a mathematical vector with arbitrary dimensions.
@@ -11,7 +110,7 @@ class Vec:
     multiplication (dot product), division, and normalization.
 
     Attributes:
-        `__coords` (tuple[float | int, ...]): The coordinates of the vector.
+        `_coords` (tuple | array | memoryview): The coordinates of the vector.
 
     Examples:
         >>> v1 = Vec(1, 2, 3)
@@ -23,6 +122,8 @@ class Vec:
         14.0
     """
 
+    __slots__ = ("_coords", "_size", "_norm", "_hash")
+
     def __init__(self, *coord) -> None:
         """
         Initialize a vector with given coordinates.
@@ -31,11 +132,200 @@ class Vec:
             *coord (float | int) or iterable: Coordinate values for the vector.
         """
         if len(coord) == 1 and isinstance(coord[0], Iterable):
-            # If a single iterable is passed, unpack its contents
-            self.__coords: tuple[float | int, ...] = tuple(coord[0])
+            # A single iterable is adopted directly when it is already a
+            # usable buffer — tuple() is the identity for tuples, and an
+            # array('d') is kept as-is like from_doubles — so passing an
+            # existing coordinate collection costs no copy.
+            source = coord[0]
+            self._coords: _Coords = (
+                source if isinstance(source, array) else tuple(source)
+            )
         else:
             # Otherwise, treat each element of coord as individual coordinates
-            self.__coords = coord
+            self._coords = coord
+
+        # Mixed int/float coordinates are normalized to float once, at
+        # construction, so every downstream op runs on the uniform float
+        # fast path; homogeneous tuples are kept as-is, preserving exact
+        # int arithmetic and display.
+        coords = self._coords
+        if not isinstance(coords, array):
+            types = set(map(type, coords))
+            if int in types and float in types:
+                self._coords = tuple(map(float, coords))
+
+        self._size: int = len(self._coords)
+        self._norm: float | None = None
+        self._hash: int | None = None
+
+    @classmethod
+    def _make(cls, coords: _Coords) -> Vec:
+        """
+        Build a Vec directly from an already-built coordinate tuple.
+
+        Internal fast path for the operators: skips __init__'s iterable
+        detection and the varargs packing/unpacking round-trip.
+
+        Args:
+            coords (_Coords): The coordinates to wrap.
+
+        Returns:
+            Vec: A new vector holding the given coordinates.
+        """
+        v: Vec = object.__new__(cls)
+        v._coords = coords
+        v._size = len(coords)
+        v._norm = None
+        v._hash = None
+        return v
+
+    @classmethod
+    def from_doubles(cls, values: Iterable[float]) -> Vec:
+        """
+        Build a Vec backed by a compact C-double buffer.
+
+        array('d') stores the coordinates as contiguous machine doubles
+        instead of a tuple of boxed floats — several times less memory
+        and better cache behavior when many coordinates are held. All
+        operators work unchanged; arithmetic results are regular
+        tuple-backed vectors.
+
+        Args:
+            values (Iterable[float]): The coordinate values.
+
+        Returns:
+            Vec: A new vector over the double buffer.
+
+        Example:
+            >>> v = Vec.from_doubles([1, 2, 3])
+            >>> v.norm()
+            3.7416573867739413
+        """
+        return cls._make(array("d", values))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[float]]) -> list[Vec]:
+        """
+        Build many same-sized vectors from the rows of a 2-D table.
+
+        All coordinates land in one contiguous array('d') buffer and
+        each returned vector holds a zero-copy view into its row, so N
+        vectors cost a single coordinate allocation instead of N — the
+        natural constructor for pairwise-distance style workloads.
+
+        Args:
+            rows (Iterable[Iterable[float]]): The rows, all of the same
+                length.
+
+        Returns:
+            list[Vec]: One vector per row, sharing a common buffer.
+
+        Raises:
+            ValueError: If the rows have different lengths.
+
+        Example:
+            >>> Vec.from_rows([[3, 4], [6, 8]])
+            [(3.0, 4.0), (6.0, 8.0)]
+        """
+        flat = array("d")
+        width: int | None = None
+        count: int = 0
+
+        for row in rows:
+            start = len(flat)
+            flat.extend(row)
+            count += 1
+
+            if width is None:
+                width = len(flat)
+            elif len(flat) - start != width:
+                raise ValueError(
+                    "Cannot build vectors from rows of different sizes"
+                )
+
+        if not width:
+            # No rows at all, or rows without coordinates: there is no
+            # buffer to slice, just (possibly zero) empty vectors.
+            return [cls._make(()) for _ in range(count)]
+
+        view = memoryview(flat)
+        return [
+            cls._make(view[i : i + width]) for i in range(0, len(flat), width)
+        ]
+
+    def as_doubles(self) -> array:
+        """
+        Return the coordinates as a compact array('d') buffer.
+
+        Returns:
+            array: The coordinates as contiguous C doubles.
+        """
+        return array("d", self._coords)
+
+    def _binop(self, other: object, op, symbol: str) -> Vec:
+        """
+        Shared body of the elementwise binary operators.
+
+        One dispatch sequence for +, - and / keeps the operators thin
+        and lets the elementwise pass run through a single map call.
+
+        Args:
+            other (Vec | int | float): The right operand.
+            op: The elementwise operation, e.g. operator.add.
+            symbol (str): The operator symbol for error messages.
+
+        Returns:
+            Vec: A new vector holding the elementwise results.
+
+        Raises:
+            ValueError: If combining vectors of different sizes.
+            TypeError: If the operation is not supported.
+        """
+        coords = _as_coords(other)
+
+        if coords is not None:
+            if self._size != len(coords):
+                raise ValueError(
+                    f"Cannot {_OP_VERBS[symbol]} vectors of different sizes"
+                )
+
+            return Vec._make(tuple(map(op, self._coords, coords)))
+
+        if isinstance(other, (int, float)):
+            return Vec._make(tuple(op(a, other) for a in self._coords))
+
+        raise _type_error(symbol, self, other)
+
+    def _rbinop(self, other: object, op, symbol: str) -> Vec:
+        """
+        Reflected counterpart of _binop, with the operands swapped.
+
+        Args:
+            other (Vec | int | float): The left operand.
+            op: The elementwise operation, e.g. operator.sub.
+            symbol (str): The operator symbol for error messages.
+
+        Returns:
+            Vec: A new vector holding the elementwise results.
+
+        Raises:
+            ValueError: If combining vectors of different sizes.
+            TypeError: If the operation is not supported.
+        """
+        coords = _as_coords(other)
+
+        if coords is not None:
+            if self._size != len(coords):
+                raise ValueError(
+                    f"Cannot {_OP_VERBS[symbol]} vectors of different sizes"
+                )
+
+            return Vec._make(tuple(map(op, coords, self._coords)))
+
+        if isinstance(other, (int, float)):
+            return Vec._make(tuple(op(other, a) for a in self._coords))
+
+        raise _type_error(symbol, other, self)
 
     def norm(self) -> float:
         """
@@ -44,7 +334,14 @@ class Vec:
         Returns:
             float: The magnitude of the vector.
         """
-        return sum(c**2 for c in self.__coords) ** 0.5
+        # Vectors are immutable, so the norm can be computed once
+        norm = self._norm
+
+        if norm is None:
+            norm = hypot(*self._coords)
+            self._norm = norm
+
+        return norm
 
     def __str__(self) -> str:
         """
@@ -53,7 +350,7 @@ class Vec:
         Returns:
             str: A string in the format "(x, y, z, ...)"
         """
-        return f"({", ".join(str(c) for c in self.__coords)})"
+        return f"({', '.join(map(str, self._coords))})"
 
     def __repr__(self) -> str:
         """
@@ -71,7 +368,7 @@ class Vec:
         Returns:
             Vec: A new vector with all coordinates negated.
         """
-        return Vec(*(-c for c in self.__coords))
+        return Vec._make(tuple(map(neg, self._coords)))
 
     def __add__(self, other: object) -> Vec:
         """
@@ -87,19 +384,11 @@ class Vec:
             ValueError: If adding vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot add vectors of different sizes")
-
-            return Vec(*(a + b for a, b in zip(self.__coords, other.__coords)))
-
-        if isinstance(other, (int, float)):
-            return Vec(*(a + other for a in self.__coords))
+        # Adding zero is a no-op; skip the elementwise pass
+        if isinstance(other, (int, float)) and other == 0:
+            return Vec._make(tuple(self._coords))
 
-        raise TypeError(
-            f"Unsupported operation (+) between types {type(self).__name__}"
-            f" and {type(other).__name__}"
-        )
+        return self._binop(other, add, "+")
 
     def __radd__(self, other: object) -> Vec:
         """
@@ -127,19 +416,10 @@ class Vec:
             ValueError: If subtracting vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot subtract vectors of different sizes")
-
-            return Vec(*(a - b for a, b in zip(self.__coords, other.__coords)))
-
-        if isinstance(other, (int, float)):
-            return Vec(*(a - other for a in self.__coords))
+        if isinstance(other, (int, float)) and other == 0:
+            return Vec._make(tuple(self._coords))
 
-        raise TypeError(
-            f"Unsupported operation (-) between types {type(self).__name__}"
-            f" and {type(other).__name__}"
-        )
+        return self._binop(other, sub, "-")
 
     def __rsub__(self, other: object) -> Vec:
         """
@@ -155,21 +435,9 @@ class Vec:
             ValueError: If subtracting vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot subtract vectors of different sizes")
-
-            return Vec(*(b - a for a, b in zip(self.__coords, other.__coords)))
-
-        if isinstance(other, (int, float)):
-            return Vec(*(other - a for a in self.__coords))
-
-        raise TypeError(
-            f"Unsupported operation (-) between types {type(other).__name__}"
-            f" and {type(self).__name__}"
-        )
+        return self._rbinop(other, sub, "-")
 
-    def __mul__(self, other: object) -> float | int:
+    def __mul__(self, other: object) -> Vec | float | int:
         """
         Multiply this vector by another vector (dot product) or a scalar.
 
@@ -177,27 +445,34 @@ class Vec:
             other (Vec | int | float): The vector or scalar to multiply by.
 
         Returns:
-            float | int: The result of the multiplication.
+            Vec | float | int: The dot product for a vector operand, or
+            a new scaled vector for a scalar operand.
 
         Raises:
             ValueError: If multiplying vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
+        coords = _as_coords(other)
+
+        if coords is not None:
+            if self._size != len(coords):
                 raise ValueError("Cannot multiply vectors of different sizes")
 
-            return sum(a * b for a, b in zip(self.__coords, other.__coords))
+            return _dot(self._coords, coords)
 
         if isinstance(other, (int, float)):
-            return sum(a * other for a in self.__coords)
+            # Multiplying by one is a no-op; skip the elementwise pass
+            if other == 1:
+                return Vec._make(tuple(self._coords))
+
+            return Vec._make(tuple(a * other for a in self._coords))
 
         raise TypeError(
             f"Unsupported operation (*) between types {type(self).__name__}"
             f" and {type(other).__name__}"
         )
 
-    def __rmul__(self, other: object) -> Vec | float:
+    def __rmul__(self, other: object) -> Vec | float | int:
         """
         Multiply this vector by another vector (dot product) or a scalar.
 
@@ -224,27 +499,50 @@ class Vec:
             bool: True if the vectors are equal, False otherwise.
         """
         if isinstance(other, Vec):
-            return self.__coords == other.__coords
+            # tuple(t) is the identity for tuples, so the common case
+            # costs nothing; array('d')-backed vectors get normalized
+            # to compare by value.
+            return tuple(self._coords) == tuple(other._coords)
 
         if isinstance(other, (int, float)) and other == 0:
-            if all(a == 0 for a in self.__coords):
-                return True
+            return all(a == 0 for a in self._coords)
 
-        return False
+        return NotImplemented
 
-    def __ne__(self, other: object) -> bool:
+    def __hash__(self) -> int:
         """
-        Check if this vector is not equal to another vector.
+        Hash the vector by its coordinates.
 
-        Args:
-            other (object): The object to compare with.
+        Only tuple-backed vectors are hashable: like tuple vs list, an
+        array- or memoryview-backed vector can be mutated in place by
+        the augmented operators, which would silently break any
+        container keyed on its hash. Tuple-backed hashes are computed
+        once and cached.
 
         Returns:
-            bool: True if the vectors are not equal, False otherwise.
+            int: The hash of the coordinate tuple.
+
+        Raises:
+            TypeError: If the vector is backed by a mutable buffer.
         """
-        return not self.__eq__(other)
+        if not isinstance(self._coords, tuple):
+            raise TypeError(
+                f"unhashable type: mutable buffer-backed "
+                f"{type(self).__name__}"
+            )
 
-    def __truediv__(self, other: object) -> Vec | float:
+        h = self._hash
+
+        if h is None:
+            t = tuple(self._coords)
+            # An all-zero vector compares equal to the scalar 0, so it
+            # must hash like the scalar to keep the hash/eq contract.
+            h = hash(0) if not any(t) else hash(t)
+            self._hash = h
+
+        return h
+
+    def __truediv__(self, other: object) -> Vec:
         """
         Divide this vector by another vector or a scalar.
 
@@ -252,7 +550,7 @@ class Vec:
             other (Vec | int | float): The vector or scalar to divide by.
 
         Returns:
-            Vec | float: A new vector representing the division result.
+            Vec: A new vector representing the division result.
 
         Raises:
             ValueError: If dividing vectors of different sizes.
@@ -263,23 +561,16 @@ class Vec:
             if other == 0:
                 raise ZeroDivisionError("Vector cannot be divided by zero")
 
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot divide vectors of different sizes")
-
-            return Vec(*(a / b for a, b in zip(self.__coords, other.__coords)))
-
-        if isinstance(other, (int, float)):
-            if other == 0:
-                raise ZeroDivisionError
+        elif other == 0:
+            raise ZeroDivisionError
 
-            return Vec(*(a / other for a in self.__coords))
+        elif other == 1:
+            # Dividing by one is a no-op; skip the elementwise pass
+            return Vec._make(tuple(self._coords))
 
-        raise TypeError(
-            f"Unsupported operation (/) between types {type(self).__name__}"
-            f" and {type(other).__name__}"
-        )
+        return self._binop(other, truediv, "/")
 
-    def __rtruediv__(self, other: object) -> Vec | float:
+    def __rtruediv__(self, other: object) -> Vec:
         """
         Divide a scalar or another vector by this vector (right-side division).
 
@@ -287,7 +578,7 @@ class Vec:
             other (Vec | int | float): The scalar or vector to be divided.
 
         Returns:
-            Vec | float: A new vector representing the division result.
+            Vec: A new vector representing the division result.
 
         Raises:
             ValueError: If dividing vectors of different sizes.
@@ -298,157 +589,153 @@ class Vec:
             if other == 0:
                 raise ZeroDivisionError("Vector cannot be divided by zero")
 
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot divide vectors of different sizes")
-
-            return Vec(*(b / a for a, b in zip(self.__coords, other.__coords)))
-
-        if isinstance(other, (int, float)):
-            if other == 0:
-                raise ZeroDivisionError
-
-            return Vec(*(other / a for a in self.__coords))
+        elif other == 0:
+            raise ZeroDivisionError
 
-        raise TypeError(
-            f"Unsupported operation (/) between types {type(other).__name__}"
-            f" and {type(self).__name__}"
-        )
+        return self._rbinop(other, truediv, "/")
 
-    def __iadd__(self, other: object) -> Vec:
+    def _iapply(self, other: object, op, symbol: str) -> Vec:
         """
-        Add another vector or a scalar to this vector in-place.
+        Update a mutable (array-backed) coordinate buffer in place.
+
+        Used by the augmented operators when the vector was built with
+        from_doubles: the buffer is overwritten element by element with
+        no new allocation, and the cached norm is dropped.
 
         Args:
-            other (Vec | int | float): The vector or scalar to add.
+            other (Vec | int | float): The right operand.
+            op: The elementwise operation, e.g. operator.add.
+            symbol (str): The operator symbol for error messages.
 
         Returns:
-            Vec: This vector after the addition.
+            Vec: This vector, after the update.
 
         Raises:
-            ValueError: If adding vectors of different sizes.
+            ValueError: If combining vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot add vectors of different sizes")
+        coords = self._coords
+        # The augmented operators only route here for array-backed
+        # vectors, so the buffer is known to be mutable.
+        assert isinstance(coords, array)
+        other_coords = _as_coords(other)
 
-            self.__coords = tuple(
-                a + b for a, b in zip(self.__coords, other.__coords)
-            )
+        if other_coords is not None:
+            if self._size != len(other_coords):
+                raise ValueError(
+                    f"Cannot {_OP_VERBS[symbol]} vectors of different sizes"
+                )
+
+            for i, b in enumerate(other_coords):
+                coords[i] = op(coords[i], b)
 
         elif isinstance(other, (int, float)):
-            self.__coords = tuple(a + other for a in self.__coords)
+            for i in range(self._size):
+                coords[i] = op(coords[i], other)
 
         else:
-            raise TypeError(
-                f"Unsupported operation (+) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            raise _type_error(symbol, self, other)
 
+        self._norm = None
         return self
 
-    def __isub__(self, other: object) -> Vec:
+    def __iadd__(self, other: object) -> Vec:
         """
-        Subtract another vector or a scalar from this vector in-place.
+        Handle += by returning a new vector.
+
+        Vec is immutable like tuple: augmented assignment rebinds the
+        name to a fresh result instead of mutating shared state.
 
         Args:
-            other (Vec | int | float): The vector or scalar to subtract.
+            other (Vec | int | float): The vector or scalar to add.
 
         Returns:
-            Vec: This vector after the subtraction.
+            Vec: A new vector representing the sum.
 
         Raises:
-            ValueError: If subtracting vectors of different sizes.
+            ValueError: If adding vectors of different sizes.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot subtract vectors of different sizes")
+        if isinstance(self._coords, array):
+            return self._iapply(other, add, "+")
 
-            self.__coords = tuple(
-                a - b for a, b in zip(self.__coords, other.__coords)
-            )
+        return self.__add__(other)
 
-        elif isinstance(other, (int, float)):
-            self.__coords = tuple(a - other for a in self.__coords)
+    def __isub__(self, other: object) -> Vec:
+        """
+        Handle -= by returning a new vector.
 
-        else:
-            raise TypeError(
-                f"Unsupported operation (-) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+        Args:
+            other (Vec | int | float): The vector or scalar to subtract.
 
-        return self
+        Returns:
+            Vec: A new vector representing the difference.
+
+        Raises:
+            ValueError: If subtracting vectors of different sizes.
+            TypeError: If the operation is not supported.
+        """
+        if isinstance(self._coords, array):
+            return self._iapply(other, sub, "-")
+
+        return self.__sub__(other)
 
     def __imul__(self, other: object) -> Vec:
         """
-        Multiply this vector by another vector or a scalar in-place.
+        Handle *= by returning a new vector.
+
+        Unlike __mul__, the scalar case scales the coordinates instead
+        of reducing to a number, preserving the historical *= behavior.
 
         Args:
             other (Vec | int | float): The vector or scalar to multiply by.
 
         Returns:
-            Vec: This vector after the multiplication.
+            Vec: A new vector representing the elementwise product.
 
         Raises:
             ValueError: If multiplying vectors of different sizes.
             TypeError: If the operation is not supported.
         """
+        if isinstance(self._coords, array):
+            return self._iapply(other, mul, "*")
+
         if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
+            if self._size != other._size:
                 raise ValueError("Cannot multiply vectors of different sizes")
 
-            self.__coords = tuple(
-                a * b for a, b in zip(self.__coords, other.__coords)
-            )
+            return Vec._make(tuple(map(mul, self._coords, other._coords)))
 
-        elif isinstance(other, (int, float)):
-            self.__coords = tuple(a * other for a in self.__coords)
+        if isinstance(other, (int, float)):
+            if other == 1:
+                return self
 
-        else:
-            raise TypeError(
-                f"Unsupported operation (*) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
+            return Vec._make(tuple(a * other for a in self._coords))
 
-        return self
+        raise _type_error("*", self, other)
 
     def __itruediv__(self, other: object) -> Vec:
         """
-        Divide this vector by another vector or a scalar in-place.
+        Handle /= by returning a new vector.
 
         Args:
             other (Vec | int | float): The vector or scalar to divide by.
 
         Returns:
-            Vec: This vector after the division.
+            Vec: A new vector representing the division result.
 
         Raises:
             ValueError: If dividing vectors of different sizes.
             ZeroDivisionError: If dividing by zero.
             TypeError: If the operation is not supported.
         """
-        if isinstance(other, Vec):
-            if len(self.__coords) != len(other.__coords):
-                raise ValueError("Cannot divide vectors of different sizes")
-
-            self.__coords = tuple(
-                a / b for a, b in zip(self.__coords, other.__coords)
-            )
-
-        elif isinstance(other, (int, float)):
-            if other == 0:
+        if isinstance(self._coords, array):
+            if isinstance(other, (int, float)) and other == 0:
                 raise ZeroDivisionError
 
-            self.__coords = tuple(a / other for a in self.__coords)
+            return self._iapply(other, truediv, "/")
 
-        else:
-            raise TypeError(
-                f"Unsupported operation (/) between types {type(self).__name__}"
-                f" and {type(other).__name__}"
-            )
-
-        return self
+        return self.__truediv__(other)
 
     def __abs__(self) -> float:
         """
@@ -466,34 +753,5 @@ class Vec:
         Returns:
             int: The number of coordinates in the vector.
         """
-        return len(self.__coords)
-
-
-def main():
-    v1 = Vec(1, 2, 3, 4, 5, 6)
-    v2 = Vec(1, 2, 3, 4, 5, 6)
-    v4 = Vec(1, 3, 4)
-    v3 = Vec(5, 6, 9)
-    v5 = Vec([1, 2, 3])
-
-    print(v5)
-
-    # print(v1 + v2)
-    print(1 + v2)
-    print(v4 * v3)
-    print(v2 + 1)
-    print(v2 - 1)
-    print(1 - v2)
-
-    print(v1 * 2)
-    print(v1 * v2)
-    print(v1)
-    print(v1 != v2)
-    zero = Vec(0, 0, 0)
-
-    print(v1 / zero)
-    # print(v1 + "hello")
-
+        return self._size
 
-if __name__ == "__main__":
-    main()
@@ -1,7 +1,7 @@
 import unittest
 from math import pi
 
-from src.mathCustom.complexe import Compl
+from src.mathCustom.complexe import Compl, ComplArray
 
 # TODO: Investigate the impact of the following line.
 # while True:
@@ -41,6 +41,15 @@ class TestComplClass(unittest.TestCase):
         self.assertEqual(c4.real, 0)
         self.assertEqual(c4.img, 0)
 
+        # 0.0 is falsy but must be kept as-is, not replaced by the default
+        c5 = Compl(0.0, 5)
+        self.assertIsInstance(c5.real, float)
+        self.assertEqual(c5.img, 5)
+
+        c6 = Compl.from_complex(2 + 3j)
+        self.assertEqual(c6.real, 2)
+        self.assertEqual(c6.img, 3)
+
     def test_norm(self):
         c = Compl(3, 4)
         self.assertAlmostEqual(c.norm(), 5)
@@ -115,6 +124,24 @@ class TestComplClass(unittest.TestCase):
         self.assertEqual(c4.real, 1.5)
         self.assertEqual(c4.img, 2)
 
+        # Regression: scalar over Compl follows other * conj(self) / |self|^2
+        # regardless of the sign of the imaginary part
+        c5 = 1 / Compl(0, -1)
+        self.assertAlmostEqual(c5.real, 0)
+        self.assertAlmostEqual(c5.img, 1)
+
+        c6 = 2 / Compl(1, 1)
+        self.assertAlmostEqual(c6.real, 1)
+        self.assertAlmostEqual(c6.img, -1)
+
+        # A zero denominator raises for both operand kinds, including
+        # the Compl-operand branch reached via direct call
+        with self.assertRaises(ZeroDivisionError):
+            1 / Compl(0, 0)
+
+        with self.assertRaises(ZeroDivisionError):
+            Compl(0, 0).__rtruediv__(Compl(1, 1))
+
     def test_power(self):
         c = Compl(1, 1)
         c2 = c**2
@@ -132,6 +159,14 @@ class TestComplClass(unittest.TestCase):
         with self.assertRaises(ValueError):
             Compl(0, 0) ** -1
 
+        c5 = Compl(1, 2) ** 3
+        self.assertEqual(c5.real, -11)
+        self.assertEqual(c5.img, -2)
+
+        c6 = Compl(1, 1) ** -1
+        self.assertAlmostEqual(c6.real, 0.5)
+        self.assertAlmostEqual(c6.img, -0.5)
+
     def test_equality(self):
         c1 = Compl(3, 4)
         c2 = Compl(3, 4)
@@ -142,6 +177,46 @@ class TestComplClass(unittest.TestCase):
 
         self.assertEqual(c1 == 5, False)
 
+        # Regression: (1 - i) is not zero even though its parts sum to 0
+        self.assertNotEqual(Compl(1, -1), 0)
+
+        # A purely real Compl compares (and hashes) like the scalar
+        self.assertEqual(Compl(5, 0), 5)
+        self.assertEqual(hash(Compl(5, 0)), hash(5))
+
+    def test_fused_helpers(self):
+        c = Compl(1, 1)
+        a = Compl(1, 2)
+        b = Compl(3, 4)
+
+        self.assertEqual(c.muladd(a, b), c + a * b)
+        self.assertEqual(c.mul_conj(b), c * b.conjugate())
+        self.assertEqual(b.mul_conj(b), Compl(25, 0))
+
+    def test_builtin_complex_operands(self):
+        c = Compl(3, 4)
+
+        self.assertEqual(c + (1 + 2j), Compl(4, 6))
+        self.assertEqual(c - (1 + 2j), Compl(2, 2))
+        self.assertEqual((1 + 2j) - c, Compl(-2, -2))
+        self.assertEqual(c * 2j, Compl(-8, 6))
+
+        quotient = c / (1 + 2j)
+        self.assertAlmostEqual(quotient.real, 2.2)
+        self.assertAlmostEqual(quotient.img, -0.4)
+
+        with self.assertRaises(ZeroDivisionError):
+            c / 0j
+
+    def test_from_to_arrays(self):
+        numbers = [Compl(1, 2), Compl(3, 4)]
+        reals, imgs = Compl.to_arrays(numbers)
+        self.assertEqual(reals, [1, 3])
+        self.assertEqual(imgs, [2, 4])
+
+        rebuilt = Compl.from_arrays(reals, imgs)
+        self.assertEqual(rebuilt, numbers)
+
     def test_in_place_operations(self):
         c = Compl(1, 1)
         c += Compl(2, 2)
@@ -160,6 +235,58 @@ class TestComplClass(unittest.TestCase):
         self.assertEqual(c.real, 2)
         self.assertEqual(c.img, 2)
 
+        # Regression: the new imaginary part must be computed from the
+        # old real part, not the freshly assigned one.
+        c2 = Compl(1, 2)
+        c2 *= Compl(3, 4)
+        self.assertEqual(c2.real, -5)
+        self.assertEqual(c2.img, 10)
+
+        c3 = Compl(3, 4)
+        c3 /= Compl(1, 2)
+        self.assertAlmostEqual(c3.real, 2.2)
+        self.assertAlmostEqual(c3.img, -0.4)
+
+
+class TestComplArrayClass(unittest.TestCase):
+    def test_initialization(self):
+        batch = ComplArray([1, 0], [0, 1])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch[0], Compl(1, 0))
+        self.assertEqual(batch[1], Compl(0, 1))
+
+        with self.assertRaises(ValueError):
+            ComplArray([1, 2], [3])
+
+    def test_compl_interop(self):
+        numbers = [Compl(1, 2), Compl(3, 4)]
+        batch = ComplArray.from_compls(numbers)
+        self.assertEqual(batch.to_compls(), numbers)
+
+    def test_arithmetic(self):
+        b1 = ComplArray([1, 3], [2, 4])
+        b2 = ComplArray([3, 1], [4, 2])
+
+        self.assertEqual(b1 + b2, ComplArray([4, 4], [6, 6]))
+        self.assertEqual(b1 * b2, ComplArray([-5, -5], [10, 10]))
+
+        quotient = ComplArray([3], [4]) / ComplArray([1], [2])
+        self.assertAlmostEqual(quotient[0].real, 2.2)
+        self.assertAlmostEqual(quotient[0].img, -0.4)
+
+        with self.assertRaises(ValueError):
+            b1 + ComplArray([1], [2])
+
+    def test_power(self):
+        batch = ComplArray([1, 0], [1, 2]) ** 2
+        self.assertAlmostEqual(batch[0].real, 0)
+        self.assertAlmostEqual(batch[0].img, 2)
+        self.assertAlmostEqual(batch[1].real, -4)
+        self.assertAlmostEqual(batch[1].img, 0)
+
+        with self.assertRaises(TypeError):
+            ComplArray([1], [1]) ** "2"
+
 
 if __name__ == "__main__":
     unittest.main()
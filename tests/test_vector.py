@@ -9,6 +9,34 @@ class TestVec(unittest.TestCase):
         self.assertEqual(str(v), "(1, 2, 3)")
         v2 = Vec([4, 5, 6])
         self.assertEqual(str(v2), "(4, 5, 6)")
+        v3 = Vec(c * 2 for c in (1, 2, 3))
+        self.assertEqual(str(v3), "(2, 4, 6)")
+
+        # Mixed int/float coordinates are normalized to float up front;
+        # all-int vectors keep their exact int coordinates
+        v4 = Vec(1, 2.5, 3)
+        self.assertEqual(str(v4), "(1.0, 2.5, 3.0)")
+
+    def test_doubles_backing(self):
+        v = Vec.from_doubles([3, 4])
+        self.assertEqual(v.norm(), 5.0)
+        self.assertEqual(str(v + Vec(1.0, 1.0)), "(4.0, 5.0)")
+        self.assertEqual(list(Vec(1, 2).as_doubles()), [1.0, 2.0])
+
+    def test_from_rows(self):
+        u, v = Vec.from_rows([[3, 4], [6, 8]])
+        self.assertEqual(str(u), "(3.0, 4.0)")
+        self.assertEqual(u.norm(), 5.0)
+        self.assertEqual(str(u + v), "(9.0, 12.0)")
+        self.assertEqual(Vec.from_rows([]), [])
+
+        # Zero-width rows yield empty vectors instead of crashing
+        empties = Vec.from_rows([[], []])
+        self.assertEqual(len(empties), 2)
+        self.assertEqual(len(empties[0]), 0)
+
+        with self.assertRaises(ValueError):
+            Vec.from_rows([[1, 2], [3]])
 
     def test_norm(self):
         v = Vec(3, 4)
@@ -52,6 +80,16 @@ class TestVec(unittest.TestCase):
         with self.assertRaises(ValueError):
             v1 - Vec(1, 2)
 
+    def test_iterable_operands(self):
+        # Bare lists and tuples broadcast like same-sized vectors
+        v = Vec(1, 2, 3)
+        self.assertEqual(str(v + [4, 5, 6]), "(5, 7, 9)")
+        self.assertEqual(str((10, 20, 30) - v), "(9, 18, 27)")
+        self.assertEqual(v * [4, 5, 6], 32)
+
+        with self.assertRaises(ValueError):
+            v + [1, 2]
+
     def test_negation(self):
         v = Vec(1, -2, 3)
         neg_v = -v
@@ -65,18 +103,25 @@ class TestVec(unittest.TestCase):
         result = v1 * v2
         self.assertEqual(result, 32)
 
-        # Scalar multiplication
+        # Scalar multiplication scales the vector
         v3 = v1 * 2
-        self.assertEqual(v3, 12)
+        self.assertEqual(str(v3), "(2, 4, 6)")
 
         # Right-side scalar multiplication
         v4 = 3 * v1
-        self.assertEqual(v4, 18)
+        self.assertEqual(str(v4), "(3, 6, 9)")
+
+        # Multiplying by one returns an equal vector unchanged
+        self.assertEqual(v1 * 1, v1)
 
         # Multiplication of vectors with different sizes should raise ValueError
         with self.assertRaises(ValueError):
             v1 * Vec(1, 2)
 
+        # Dot product beyond the unrolled 2-D/3-D sizes
+        self.assertEqual(Vec(1, 2) * Vec(3, 4), 11)
+        self.assertEqual(Vec(1, 2, 3, 4) * Vec(5, 6, 7, 8), 70)
+
     def test_division(self):
         v1 = Vec(10, 20, 30)
 
@@ -102,6 +147,19 @@ class TestVec(unittest.TestCase):
         v3 = Vec(0, 0, 0)
         self.assertEqual(v1, v2)
         self.assertNotEqual(v1, v3)
+        self.assertEqual(v3, 0)
+
+        # Equal tuple-backed vectors hash equally; vectors over a
+        # mutable buffer are unhashable, like list
+        self.assertEqual(hash(v1), hash(v2))
+        self.assertEqual(Vec(1.0, 2.0), Vec.from_doubles([1, 2]))
+        with self.assertRaises(TypeError):
+            hash(Vec.from_doubles([1, 2]))
+        self.assertEqual(len({Vec(1, 2, 3), Vec(1, 2, 3)}), 1)
+
+        # An all-zero vector equals the scalar 0, so it hashes like it
+        self.assertEqual(hash(v3), hash(0))
+        self.assertEqual(len({0, v3}), 1)
 
     def test_inplace_operations(self):
         v1 = Vec(1, 2, 3)
@@ -122,6 +180,32 @@ class TestVec(unittest.TestCase):
         v1 /= 2
         self.assertEqual(str(v1), "(1.0, 2.0, 3.0)")
 
+    def test_immutability(self):
+        # Augmented assignment rebinds to a new vector, leaving
+        # other references to the original untouched
+        v1 = Vec(1, 2, 3)
+        alias = v1
+        v1 += Vec(1, 1, 1)
+        self.assertEqual(str(alias), "(1, 2, 3)")
+        self.assertEqual(str(v1), "(2, 3, 4)")
+
+    def test_inplace_doubles_mutation(self):
+        # Array-backed vectors update their buffer in place
+        v = Vec.from_doubles([1, 2, 3])
+        alias = v
+        v += Vec(1, 1, 1)
+        self.assertIs(v, alias)
+        self.assertEqual(str(v), "(2.0, 3.0, 4.0)")
+
+        v *= 2
+        self.assertEqual(str(v), "(4.0, 6.0, 8.0)")
+        self.assertEqual(v.norm(), (16 + 36 + 64) ** 0.5)
+
+    def test_norm_is_cached(self):
+        v = Vec(3, 4)
+        self.assertEqual(v.norm(), 5.0)
+        self.assertEqual(v.norm(), 5.0)
+
 
 if __name__ == "__main__":
     unittest.main()